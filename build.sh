@@ -0,0 +1,8 @@
+#!/usr/bin/env bash
+# Build step for the deploy (Render build command: ./build.sh).
+# collectstatic writes the hashed files and staticfiles.json manifest that
+# CompressedManifestStaticFilesStorage needs before any page can render.
+set -o errexit
+
+pip install -r requirements.txt
+python manage.py collectstatic --noinput
@@ -0,0 +1,28 @@
+const form = document.getElementById('loginForm');
+
+form.addEventListener('submit', async (e) => {
+  e.preventDefault();
+
+  const email = document.getElementById('email').value;
+  const password = document.getElementById('password').value;
+
+  try {
+    const res = await fetch('https://helpdeskmini-8uue.onrender.com/api/token/', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ email, password })
+    });
+
+    const data = await res.json();
+
+    if (res.ok) {
+      localStorage.setItem('access_token', data.access);
+      localStorage.setItem('refresh_token', data.refresh);
+      window.location.href = '/tickets/';
+    } else {
+      document.getElementById('loginError').innerText = data.detail || 'Login failed';
+    }
+  } catch (err) {
+    document.getElementById('loginError').innerText = 'Network error';
+  }
+});
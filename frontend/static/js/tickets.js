@@ -0,0 +1,287 @@
+const accessToken = localStorage.getItem('access_token');
+if (!accessToken) {
+  alert('You are not logged in! Redirecting...');
+  window.location.href = '/login/';
+}
+
+let currentOffset = 0;
+const limit = 5;
+let agents = [];
+
+// Rendered cards by ticket id, so refreshes only touch what changed
+const cards = new Map();
+// Tickets whose details (comments + timeline) are open
+const expanded = new Set();
+
+function authHeaders(extra = {}) {
+  return { 'Authorization': `Bearer ${accessToken}`, ...extra };
+}
+
+function escapeHtml(value) {
+  const div = document.createElement('div');
+  div.textContent = value ?? '';
+  return div.innerHTML;
+}
+
+// Logout
+function logout() {
+  localStorage.removeItem('access_token');
+  localStorage.removeItem('refresh_token');
+  window.location.href = '/';
+}
+
+// Fetch agents for admin assign dropdown
+async function fetchAgents() {
+  try {
+    const res = await fetch('/api/users/?role=agent', { headers: authHeaders() });
+    if (!res.ok) throw new Error('Failed to load agents');
+    agents = await res.json();
+  } catch (err) {
+    console.error(err);
+  }
+}
+
+// Format SLA
+function formatSLA(slaRemaining) {
+  if (slaRemaining === 'Breached') return '⚠ SLA Breached!';
+  return slaRemaining;
+}
+
+// Build an empty card; patchCard fills it in
+function createCard(t) {
+  const el = document.createElement('div');
+  el.className = 'card mb-3 p-3 bg-dark bg-opacity-75 text-white shadow rounded-4';
+  el.dataset.id = t.id;
+  el.innerHTML = `
+    <h5><span class="ticket-title"></span>
+      <span class="badge text-white ticket-status"></span>
+    </h5>
+    <p class="ticket-description"></p>
+    <small>Priority: <span class="ticket-priority"></span> | SLA: <span class="sla-timer"></span> | Comments: <span class="ticket-comment-count"></span></small>
+    <br><br>
+    <button class="btn btn-sm btn-primary me-2" data-action="status">Mark In Progress</button>
+    <button class="btn btn-sm btn-secondary me-2" data-action="comment">Add Comment</button>
+    <button class="btn btn-sm btn-info" data-action="details">View Details</button>
+    <div class="ticket-details" hidden>
+      <div class="ticket-comments mt-2"></div>
+      <div class="ticket-timeline mt-2"></div>
+    </div>
+    <div class="ticket-assign"></div>
+  `;
+  return el;
+}
+
+// Write changed fields of a ticket into its card
+function patchCard(el, t, prev) {
+  const set = (selector, text) => {
+    const node = el.querySelector(selector);
+    if (node.textContent !== text) node.textContent = text;
+  };
+  set('.ticket-title', t.title);
+  set('.ticket-status', t.status.replace('_', ' '));
+  set('.ticket-description', t.description);
+  set('.ticket-priority', t.priority);
+  set('.sla-timer', formatSLA(t.sla_remaining));
+  set('.ticket-comment-count', String(t.comment_count));
+
+  el.querySelector('.ticket-status').className = `badge text-white ticket-status badge-${t.status}`;
+  el.classList.toggle('ticket-breached', t.sla_remaining === 'Breached' && t.status !== 'closed');
+
+  if (t.user_role === 'admin' && (!prev || prev.assignee !== t.assignee)) {
+    el.querySelector('.ticket-assign').innerHTML = `
+      <div class="mt-2">
+        <label class="form-label">Assign to Agent:</label>
+        <select class="form-select mb-2" data-action="assign">
+          <option value="">Select Agent</option>
+          ${agents.map(a => `<option value="${a.id}" ${t.assignee === a.username ? 'selected' : ''}>${escapeHtml(a.username)}</option>`).join('')}
+        </select>
+      </div>`;
+  }
+}
+
+function pager() {
+  let el = document.getElementById('pager');
+  if (!el) {
+    el = document.createElement('div');
+    el.id = 'pager';
+    el.className = 'd-flex justify-content-between mt-3';
+    el.innerHTML = `
+      <button class="btn btn-sm btn-outline-light" onclick="prevPage()">Prev</button>
+      <button class="btn btn-sm btn-outline-light" onclick="nextPage()">Next</button>
+    `;
+    document.getElementById('tickets').appendChild(el);
+  }
+  return el;
+}
+
+// Load Tickets with Pagination (summary fields only)
+async function loadTickets(offset = 0) {
+  try {
+    const search = document.getElementById('searchInput').value;
+    const url = `/api/tickets/?limit=${limit}&offset=${offset}&search=${encodeURIComponent(search)}`;
+    const res = await fetch(url, { headers: authHeaders() });
+    if (!res.ok) throw new Error('Failed to load tickets');
+    const data = await res.json();
+    const container = document.getElementById('tickets');
+    const nav = pager();
+
+    // Drop cards that are no longer on this page
+    const ids = new Set(data.results.map(t => t.id));
+    for (const [id, card] of cards) {
+      if (!ids.has(id)) {
+        card.el.remove();
+        cards.delete(id);
+        expanded.delete(id);
+      }
+    }
+
+    data.results.forEach((t, i) => {
+      let card = cards.get(t.id);
+      if (!card) {
+        card = { el: createCard(t), ticket: null };
+        cards.set(t.id, card);
+      }
+      const prev = card.ticket;
+      patchCard(card.el, t, prev);
+      card.ticket = t;
+
+      // Keep page order without re-inserting cards already in place
+      if (container.children[i] !== card.el) container.insertBefore(card.el, container.children[i] || nav);
+
+      if (expanded.has(t.id) && prev && (prev.version !== t.version || prev.comment_count !== t.comment_count)) {
+        loadDetails(t.id);
+      }
+    });
+
+    const [prevBtn, nextBtn] = nav.querySelectorAll('button');
+    prevBtn.disabled = offset <= 0;
+    nextBtn.disabled = !data.next;
+    currentOffset = offset;
+
+  } catch (err) {
+    console.error(err);
+    alert('Error loading tickets. Please login again.');
+    window.location.href = '/login/';
+  }
+}
+
+function nextPage() { loadTickets(currentOffset + limit); }
+function prevPage() { loadTickets(Math.max(currentOffset - limit, 0)); }
+
+// Render Comments recursively
+function renderComments(comments) {
+  return comments.map(c => {
+    const repliesHTML = (c.replies || []).map(r => `<div class="comment-reply">${renderComments([r])}</div>`).join('');
+    return `<div><small><b>${escapeHtml(c.user)}</b>: ${escapeHtml(c.text)}</small>${repliesHTML}</div>`;
+  }).join('');
+}
+
+function renderTimeline(logs) {
+  return logs.map(l => `<small>${escapeHtml(l.action_type)} by ${escapeHtml(l.metadata?.user || 'unknown')} at ${new Date(l.created_at).toLocaleString()}</small><br>`).join('');
+}
+
+// Fetch comments and timeline for one ticket, only when it is expanded
+async function loadDetails(ticketId) {
+  const card = cards.get(ticketId);
+  if (!card) return;
+  try {
+    const res = await fetch(`/api/tickets/${ticketId}/`, { headers: authHeaders() });
+    if (!res.ok) throw new Error('Failed to load ticket details');
+    const t = await res.json();
+    card.el.querySelector('.ticket-comments').innerHTML = renderComments(t.comments || []);
+    card.el.querySelector('.ticket-timeline').innerHTML = renderTimeline(t.timeline_logs || []);
+  } catch (err) { console.error(err); }
+}
+
+function toggleDetails(ticketId) {
+  const details = cards.get(ticketId).el.querySelector('.ticket-details');
+  if (expanded.has(ticketId)) {
+    expanded.delete(ticketId);
+    details.hidden = true;
+  } else {
+    expanded.add(ticketId);
+    details.hidden = false;
+    loadDetails(ticketId);
+  }
+}
+
+// Create Ticket
+document.getElementById('ticketForm').addEventListener('submit', async e => {
+  e.preventDefault();
+  const title = document.getElementById('title').value;
+  const description = document.getElementById('description').value;
+  const priority = document.getElementById('priority').value;
+
+  try {
+    const res = await fetch('/api/tickets/', {
+      method: 'POST',
+      headers: authHeaders({ 'Content-Type': 'application/json' }),
+      body: JSON.stringify({ title, description, priority })
+    });
+    if (!res.ok) throw new Error('Failed to create ticket');
+    document.getElementById('ticketForm').reset();
+    loadTickets(currentOffset);
+  } catch (err) { alert(err.message); }
+});
+
+// Update Status
+async function updateStatus(ticketId) {
+  try {
+    const res = await fetch(`/api/tickets/${ticketId}/`, {
+      method: 'PATCH',
+      headers: authHeaders({ 'Content-Type': 'application/json' }),
+      body: JSON.stringify({ status: 'in_progress' })
+    });
+    if (!res.ok) throw new Error('Failed to update status');
+    loadTickets(currentOffset);
+  } catch (err) { alert(err.message); }
+}
+
+// Add Comment
+async function addComment(ticketId) {
+  const text = prompt('Enter your comment:');
+  if (!text) return;
+  try {
+    const res = await fetch(`/api/tickets/${ticketId}/add_comment/`, {
+      method: 'POST',
+      headers: authHeaders({ 'Content-Type': 'application/json' }),
+      body: JSON.stringify({ text })
+    });
+    if (!res.ok) throw new Error('Failed to add comment');
+    loadTickets(currentOffset);
+  } catch (err) { alert(err.message); }
+}
+
+// Assign Agent
+async function assignAgent(ticketId, agentId) {
+  if (!agentId) return;
+  try {
+    const res = await fetch(`/api/tickets/${ticketId}/assign_agent/`, {
+      method: 'PATCH',
+      headers: authHeaders({ 'Content-Type': 'application/json' }),
+      body: JSON.stringify({ agent_id: agentId })
+    });
+    if (!res.ok) throw new Error('Failed to assign agent');
+    loadTickets(currentOffset);
+  } catch (err) { alert(err.message); }
+}
+
+// Card buttons, handled once for the whole list
+const ticketsContainer = document.getElementById('tickets');
+ticketsContainer.addEventListener('click', e => {
+  const button = e.target.closest('button[data-action]');
+  if (!button) return;
+  const ticketId = Number(button.closest('[data-id]').dataset.id);
+  if (button.dataset.action === 'status') updateStatus(ticketId);
+  else if (button.dataset.action === 'comment') addComment(ticketId);
+  else if (button.dataset.action === 'details') toggleDetails(ticketId);
+});
+ticketsContainer.addEventListener('change', e => {
+  if (e.target.dataset.action !== 'assign') return;
+  assignAgent(Number(e.target.closest('[data-id]').dataset.id), e.target.value);
+});
+
+// Real-time SLA update every minute
+setInterval(() => { loadTickets(currentOffset); }, 60000);
+
+window.onload = async () => { await fetchAgents(); loadTickets(0); };
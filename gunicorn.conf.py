@@ -0,0 +1,60 @@
+# gunicorn.conf.py
+# Worker presets for the Procfile command, picked with GUNICORN_PRESET.
+#
+# Counts are small fixed defaults, not derived from the CPU count, which in a
+# container reports the host's cores. Override with WEB_CONCURRENCY and
+# GUNICORN_THREADS. Postgres connections per web instance:
+#   persistent: WEB_CONCURRENCY x GUNICORN_THREADS (one per thread)
+#   pool:       WEB_CONCURRENCY x DJANGO_DB_POOL_MAX (one pool per process)
+# plus DJANGO_DB_POOL_MAX (or --threads + 1) for each run_worker process.
+# Defaults: threaded 2 x 4 = 8, sync 3 x 1 = 3. Keep the sum across all
+# instances under the plan's max_connections.
+import os
+
+PRESETS = {
+    # One request per process
+    'sync': {'worker_class': 'sync', 'workers': 3, 'threads': 1},
+    # Fewer processes, several threads each; pairs with the psycopg pool
+    'threaded': {'worker_class': 'gthread', 'workers': 2, 'threads': 4},
+}
+
+preset_name = os.environ.get('GUNICORN_PRESET', 'threaded')
+if preset_name not in PRESETS:
+    raise RuntimeError(f"Unknown GUNICORN_PRESET: {preset_name} (expected one of: {', '.join(PRESETS)})")
+preset = PRESETS[preset_name]
+
+worker_class = preset['worker_class']
+workers = int(os.environ.get('WEB_CONCURRENCY', preset['workers']))
+threads = int(os.environ.get('GUNICORN_THREADS', preset['threads']))
+
+keepalive = 5
+timeout = 30
+# Recycle workers now and then so long-lived connections don't pile up state
+max_requests = 1000
+max_requests_jitter = 100
+
+# GUNICORN_PRELOAD=True loads Django once in the master so forked workers
+# start warm and share memory copy-on-write.
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'False') == 'True'
+
+
+def _close_db_connections():
+    # A socket opened before fork would be shared by every worker
+    from django.db import connections
+    for conn in connections.all(initialized_only=True):
+        conn.close()
+        if hasattr(conn, 'close_pool'):
+            conn.close_pool()
+
+
+def when_ready(server):
+    if preload_app:
+        # Import views/serializers now rather than on each worker's first request
+        from django.urls import get_resolver
+        get_resolver().url_patterns
+        _close_db_connections()
+
+
+def pre_fork(server, worker):
+    if preload_app:
+        _close_db_connections()
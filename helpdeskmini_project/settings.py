@@ -6,6 +6,7 @@ Updated for production deployment (Render).
 from pathlib import Path
 import os
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -31,6 +32,7 @@ INSTALLED_APPS = [
     'corsheaders',
     'tickets',
     'frontend',
+    'jobs',
 ]
 
 MIDDLEWARE = [
@@ -83,6 +85,24 @@ TEMPLATES = [
     },
 ]
 
+# Lean production mode (DJANGO_LEAN=True): skip the admin and the messages
+# framework it depends on, which the API and frontend don't use. The admin
+# URLs are not mounted in this mode. CORS stays, as cross-origin clients are
+# allowed above.
+LEAN = os.environ.get('DJANGO_LEAN', 'False') == 'True'
+if LEAN:
+    LEAN_SKIP = (
+        'django.contrib.admin',
+        'django.contrib.messages',
+        'django.contrib.messages.middleware.MessageMiddleware',
+        'django.contrib.messages.context_processors.messages',
+    )
+    INSTALLED_APPS = [a for a in INSTALLED_APPS if a not in LEAN_SKIP]
+    MIDDLEWARE = [m for m in MIDDLEWARE if m not in LEAN_SKIP]
+    TEMPLATES[0]['OPTIONS']['context_processors'] = [
+        c for c in TEMPLATES[0]['OPTIONS']['context_processors'] if c not in LEAN_SKIP
+    ]
+
 WSGI_APPLICATION = 'helpdeskmini_project.wsgi.application'
 
 # Database configuration using dj_database_url for Render Postgres
@@ -92,6 +112,58 @@ DATABASES = {
     )
 }
 
+# Read replicas: comma-separated database URLs (a second SQLite file works locally).
+# Safe reads from the ticket API go to a random replica; writes stay on default.
+DATABASE_REPLICAS = []
+for i, url in enumerate(u for u in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if u.strip()):
+    alias = f'replica_{i}'
+    DATABASES[alias] = dj_database_url.parse(url.strip())
+    DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['tickets.db_router.ReplicaRouter']
+
+# Connection strategy for gunicorn workers (DJANGO_DB_CONN_STRATEGY):
+#   none       - open a new connection per request (Django's default)
+#   persistent - reuse a worker's connection for DJANGO_CONN_MAX_AGE seconds, health-checked
+#   pool       - psycopg 3 connection pool per worker process (Postgres only)
+DB_CONN_STRATEGY = os.environ.get('DJANGO_DB_CONN_STRATEGY', 'persistent')
+if DB_CONN_STRATEGY not in ('none', 'persistent', 'pool'):
+    raise ImproperlyConfigured(f"Unknown DJANGO_DB_CONN_STRATEGY: {DB_CONN_STRATEGY}")
+
+for db in DATABASES.values():
+    if DB_CONN_STRATEGY == 'persistent':
+        db['CONN_MAX_AGE'] = int(os.environ.get('DJANGO_CONN_MAX_AGE', '60'))
+        db['CONN_HEALTH_CHECKS'] = True
+    elif DB_CONN_STRATEGY == 'pool' and db['ENGINE'] == 'django.db.backends.postgresql':
+        # Pooling needs psycopg 3; Django picks it over psycopg2 when installed
+        db['CONN_MAX_AGE'] = 0
+        db.setdefault('OPTIONS', {})['pool'] = {
+            'min_size': int(os.environ.get('DJANGO_DB_POOL_MIN', '1')),
+            # One connection per gunicorn thread is enough
+            'max_size': int(os.environ.get('DJANGO_DB_POOL_MAX', os.environ.get('GUNICORN_THREADS', '4'))),
+            'timeout': int(os.environ.get('DJANGO_DB_POOL_TIMEOUT', '10')),
+        }
+
+# After a write, keep the user's reads on the primary for this many seconds
+# (tracked per user in User.last_write_at, so it covers all of their clients)
+REPLICA_STICKY_SECONDS = int(os.environ.get('DJANGO_REPLICA_STICKY_SECONDS', '5'))
+
+# Background jobs (python manage.py run_worker)
+# Periodic jobs: name -> seconds between runs
+JOB_SCHEDULE = {
+    'sla_breach_check': 300,
+    'purge_idempotency_keys': 3600,
+    'archive_timeline_logs': 86400,
+    'reconcile_ticket_summaries': 86400,
+    'purge_finished_jobs': 3600,
+}
+JOB_RETRY_BACKOFF = 30  # seconds, doubled on each attempt
+JOB_LOCK_TIMEOUT = 600  # requeue running jobs with no worker heartbeat for this long
+JOB_HISTORY_HOURS = 24
+IDEMPOTENCY_KEY_TTL_HOURS = 24
+TIMELINE_RETENTION_DAYS = 180  # then closed tickets' timeline moves to the archive table
+
 # Custom User model
 AUTH_USER_MODEL = 'tickets.User'
 
@@ -113,7 +185,18 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / "frontend/static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Hashed, compressed files; whitenoise serves them with far-future cache headers
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Budget for `manage.py startup_profile`: process start to first response
+STARTUP_TARGET_MS = int(os.environ.get('DJANGO_STARTUP_TARGET_MS', '1500'))
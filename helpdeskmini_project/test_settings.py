@@ -0,0 +1,10 @@
+"""
+Settings for `manage.py test`: defines a replica that mirrors the test
+database. Routing to it stays off unless a test enables it with
+override_settings(DATABASE_REPLICAS=['replica_0']).
+"""
+
+from .settings import *  # noqa: F401,F403
+
+DATABASES['replica_0'] = {**DATABASES['default'], 'TEST': {'MIRROR': 'default'}}
+DATABASE_REPLICAS = []
@@ -0,0 +1,11 @@
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from .models import Job
+from .queue import job
+
+
+@job()
+def purge_finished_jobs():
+    cutoff = timezone.now() - timedelta(hours=settings.JOB_HISTORY_HOURS)
+    Job.objects.filter(status='done', finished_at__lt=cutoff).delete()
@@ -0,0 +1,92 @@
+import logging
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connections
+from jobs import queue
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Run background jobs from the database queue. Start more processes to scale out."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads', type=int, default=None,
+            help="Job threads; defaults to 4, or DJANGO_DB_POOL_MAX - 1 with the connection pool.",
+        )
+        parser.add_argument('--poll-interval', type=float, default=1.0)
+
+    def handle(self, *args, **options):
+        threads = self._threads(options['threads'])
+        stop = threading.Event()
+        previous = {sig: signal.signal(sig, lambda *_: stop.set()) for sig in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            self._loop(threads, stop, options['poll_interval'])
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            connections.close_all()
+        self.stdout.write("Worker stopped")
+
+    def _loop(self, threads, stop, poll_interval):
+        self.stdout.write(f"Worker started with {threads} threads")
+        in_flight = {}  # future -> job id
+        last_slot = None
+        failures = 0
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            while not stop.is_set():
+                in_flight = {f: pk for f, pk in in_flight.items() if not f.done()}
+                try:
+                    close_old_connections()
+
+                    # Heartbeat, scheduling and stale-lock recovery every few seconds
+                    slot = int(time.time()) // 5
+                    if slot != last_slot:
+                        queue.heartbeat(list(in_flight.values()))
+                        queue.enqueue_scheduled()
+                        queue.recover_stale()
+                        last_slot = slot
+
+                    free = threads - len(in_flight)
+                    claimed = queue.claim(free) if free else []
+                except Exception:
+                    # Transient DB trouble (e.g. SQLite "database is locked"): back off and retry
+                    failures += 1
+                    logger.exception("Worker loop failed (%s in a row)", failures)
+                    stop.wait(min(60, poll_interval * 2 ** failures))
+                    continue
+                failures = 0
+
+                for job in claimed:
+                    in_flight[pool.submit(self._run, job)] = job.pk
+                if not claimed:
+                    stop.wait(poll_interval)
+
+    def _run(self, job):
+        try:
+            queue.run(job)
+        except Exception:
+            # Recording the outcome failed; recover_stale picks the job up later
+            logger.exception("Could not record result of job %s", job)
+        finally:
+            # Each pool thread holds its own connection
+            connections.close_all()
+
+    def _threads(self, requested):
+        # Each job thread and the main loop may hold a connection at once
+        pool = settings.DATABASES['default'].get('OPTIONS', {}).get('pool')
+        if not isinstance(pool, dict):
+            return requested or 4
+        limit = pool['max_size'] - 1
+        if limit < 1:
+            raise CommandError("DJANGO_DB_POOL_MAX must be at least 2 to run the worker")
+        if requested is None:
+            return limit
+        if not 1 <= requested <= limit:
+            raise CommandError(f"--threads must be between 1 and {limit} with a pool of {pool['max_size']} connections")
+        return requested
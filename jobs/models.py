@@ -0,0 +1,32 @@
+from django.db import models
+from django.utils import timezone
+
+# -----------------------------
+# Job Model (database-backed queue)
+# -----------------------------
+class Job(models.Model):
+    STATUS_CHOICES = (
+        ('queued','Queued'),
+        ('running','Running'),
+        ('done','Done'),
+        ('failed','Failed'),
+    )
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    # Set for scheduled runs so several workers can't enqueue the same slot
+    dedupe_key = models.CharField(max_length=255, unique=True, null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'run_at'], name='jobs_status_run_at_idx')]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
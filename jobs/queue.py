@@ -0,0 +1,116 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# name -> function, filled by @job in each app's jobs.py
+_registry = {}
+
+
+def job(name=None):
+    """Register a function as a background job; payload keys become kwargs."""
+    def decorator(func):
+        _registry[name or func.__name__] = func
+        return func
+    return decorator
+
+
+def enqueue(name, payload=None, run_at=None, delay=0, dedupe_key=None, max_attempts=3):
+    """Queue a job. Returns None if a job with the same dedupe_key already exists."""
+    if name not in _registry:
+        raise KeyError(f"Unknown job: {name}")
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                payload=payload or {},
+                run_at=run_at or timezone.now() + timedelta(seconds=delay),
+                dedupe_key=dedupe_key,
+                max_attempts=max_attempts,
+            )
+    except IntegrityError:
+        return None
+
+
+def enqueue_scheduled(now=None):
+    """Queue one run of each JOB_SCHEDULE entry per interval slot."""
+    now = now or timezone.now()
+    jobs = []
+    for name, interval in settings.JOB_SCHEDULE.items():
+        if name not in _registry:
+            raise KeyError(f"Unknown job: {name}")
+        slot = int(now.timestamp()) // interval
+        jobs.append(Job(name=name, run_at=now, dedupe_key=f"{name}@{slot}"))
+    # Every worker calls this every few seconds; existing slots are skipped
+    # by the database (ON CONFLICT DO NOTHING) instead of raising
+    Job.objects.bulk_create(jobs, ignore_conflicts=True)
+
+
+def heartbeat(job_ids):
+    """Refresh locked_at on jobs this worker is still running."""
+    if job_ids:
+        Job.objects.filter(pk__in=job_ids, status='running').update(locked_at=timezone.now())
+
+
+def recover_stale(now=None):
+    """Requeue jobs whose worker stopped heartbeating; fail those out of attempts."""
+    now = now or timezone.now()
+    cutoff = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT)
+    stale = Job.objects.filter(status='running', locked_at__lt=cutoff)
+    stale.filter(attempts__gte=F('max_attempts')).update(
+        status='failed', locked_at=None, finished_at=now, last_error="Worker stopped while running the job",
+    )
+    stale.filter(attempts__lt=F('max_attempts')).update(status='queued', locked_at=None)
+
+
+def claim(limit):
+    """Mark up to `limit` due jobs as running for this worker and return them."""
+    now = timezone.now()
+    due = Job.objects.filter(status='queued', run_at__lte=now).order_by('run_at')
+    claimed = dict(status='running', locked_at=now, attempts=F('attempts') + 1)
+
+    if connection.features.has_select_for_update_skip_locked:
+        # Postgres: concurrent workers skip each other's rows instead of blocking
+        with transaction.atomic():
+            jobs = list(due.select_for_update(skip_locked=True)[:limit])
+            Job.objects.filter(pk__in=[j.pk for j in jobs]).update(**claimed)
+    else:
+        # SQLite: no row locks, so claim each row with a conditional UPDATE
+        jobs = [
+            j for j in due[:limit]
+            if Job.objects.filter(pk=j.pk, status='queued').update(**claimed)
+        ]
+
+    for j in jobs:
+        j.status = 'running'
+        j.attempts += 1
+    return jobs
+
+
+def run(job):
+    """Execute a claimed job and record the outcome, retrying with backoff on failure."""
+    try:
+        func = _registry.get(job.name)
+        if func is None:
+            raise KeyError(f"Unknown job: {job.name}")
+        func(**job.payload)
+    except Exception as exc:
+        logger.exception("Job %s failed (attempt %s/%s)", job, job.attempts, job.max_attempts)
+        now = timezone.now()
+        if job.attempts < job.max_attempts:
+            backoff = settings.JOB_RETRY_BACKOFF * 2 ** (job.attempts - 1)
+            Job.objects.filter(pk=job.pk).update(
+                status='queued', locked_at=None, last_error=str(exc),
+                run_at=now + timedelta(seconds=backoff),
+            )
+        else:
+            Job.objects.filter(pk=job.pk).update(
+                status='failed', locked_at=None, last_error=str(exc), finished_at=now,
+            )
+    else:
+        Job.objects.filter(pk=job.pk).update(status='done', locked_at=None, finished_at=timezone.now())
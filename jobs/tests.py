@@ -0,0 +1,118 @@
+import signal
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from .models import Job
+from .queue import job, enqueue, enqueue_scheduled, claim, run, heartbeat, recover_stale
+
+calls = []
+
+
+@job('test_ok')
+def ok(**payload):
+    calls.append(payload)
+
+
+@job('test_fail')
+def fail():
+    raise RuntimeError("boom")
+
+
+@override_settings(JOB_RETRY_BACKOFF=10, JOB_LOCK_TIMEOUT=60)
+class QueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_unknown_job(self):
+        with self.assertRaises(KeyError):
+            enqueue('nope')
+
+    def test_claim_and_run(self):
+        enqueue('test_ok', {'x': 1})
+        enqueue('test_ok', delay=3600)  # not due yet
+
+        jobs = claim(10)
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0].attempts, 1)
+        self.assertEqual(claim(10), [])  # already running
+
+        run(jobs[0])
+        self.assertEqual(calls, [{'x': 1}])
+        self.assertEqual(Job.objects.get(pk=jobs[0].pk).status, 'done')
+
+    def test_retry_with_backoff_then_fail(self):
+        queued = enqueue('test_fail', max_attempts=2)
+
+        start = timezone.now()
+        with self.assertLogs('jobs.queue', level='ERROR'):
+            run(claim(1)[0])
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, 'queued')
+        self.assertEqual(queued.last_error, 'boom')
+        self.assertGreaterEqual(queued.run_at, start + timedelta(seconds=10))
+        self.assertEqual(claim(1), [])  # waiting out the backoff
+
+        Job.objects.filter(pk=queued.pk).update(run_at=timezone.now())
+        with self.assertLogs('jobs.queue', level='ERROR'):
+            run(claim(1)[0])
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, 'failed')
+        self.assertEqual(queued.attempts, 2)
+
+    @override_settings(JOB_SCHEDULE={'test_ok': 300})
+    def test_enqueue_scheduled_dedupes_per_slot(self):
+        now = timezone.now()
+        enqueue_scheduled(now)
+        enqueue_scheduled(now)
+        self.assertEqual(Job.objects.filter(name='test_ok').count(), 1)
+
+        enqueue_scheduled(now + timedelta(seconds=300))
+        self.assertEqual(Job.objects.filter(name='test_ok').count(), 2)
+
+    def test_recover_stale(self):
+        retry = enqueue('test_ok', max_attempts=2)
+        exhausted = enqueue('test_ok', max_attempts=1)
+        claim(2)
+
+        later = timezone.now() + timedelta(seconds=61)
+        recover_stale(later)
+        retry.refresh_from_db()
+        exhausted.refresh_from_db()
+        self.assertEqual(retry.status, 'queued')
+        self.assertEqual(exhausted.status, 'failed')
+
+        # Out of attempts after the second crash, not requeued forever
+        claim(1)
+        recover_stale(later + timedelta(seconds=61))
+        retry.refresh_from_db()
+        self.assertEqual(retry.status, 'failed')
+        self.assertEqual(retry.attempts, 2)
+
+    def test_heartbeat_keeps_running_job(self):
+        running = enqueue('test_ok')
+        claim(1)
+
+        later = timezone.now() + timedelta(seconds=61)
+        with mock.patch('jobs.queue.timezone.now', return_value=later):
+            heartbeat([running.pk])
+        recover_stale(later)
+        running.refresh_from_db()
+        self.assertEqual(running.status, 'running')
+
+
+# The worker opens and closes its own connections, so no wrapping transaction
+class WorkerTests(TransactionTestCase):
+    def test_worker_survives_transient_db_errors(self):
+        # Second claim escapes the loop on purpose to end the test
+        side_effect = [OperationalError('database is locked'), KeyboardInterrupt]
+        handler = signal.getsignal(signal.SIGINT)
+        with mock.patch('jobs.queue.claim', side_effect=side_effect) as claim_mock:
+            with self.assertLogs('jobs.management.commands.run_worker', level='ERROR'):
+                with self.assertRaises(KeyboardInterrupt):
+                    call_command('run_worker', '--poll-interval', '0.01', stdout=StringIO())
+        self.assertEqual(claim_mock.call_count, 2)
+        self.assertIs(signal.getsignal(signal.SIGINT), handler)
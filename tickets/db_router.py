@@ -0,0 +1,98 @@
+import random
+from contextvars import ContextVar
+from datetime import timedelta
+from functools import wraps
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.permissions import SAFE_METHODS
+
+# Replica alias chosen for the current request, or None to use the primary
+_replica_alias = ContextVar('replica_alias', default=None)
+
+def pin_primary(user):
+    """Keep this user's reads on the primary for a short window after a write."""
+    # Stored on the user row, so every client and worker sees it: JWT
+    # authentication loads the user from the primary on each request
+    user.last_write_at = timezone.now()
+    type(user).objects.filter(pk=user.pk).update(last_write_at=user.last_write_at)
+
+
+def pick_replica(request):
+    """Return the replica alias for a safe, unpinned request, else None."""
+    if not settings.DATABASE_REPLICAS or request.method not in SAFE_METHODS:
+        return None
+    last_write_at = getattr(request.user, 'last_write_at', None)
+    if last_write_at and timezone.now() - last_write_at < timedelta(seconds=settings.REPLICA_STICKY_SECONDS):
+        return None
+    # One replica per request so paginated counts and pages agree
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+# -----------------------------
+# Database router
+# -----------------------------
+class ReplicaRouter:
+    """
+    Send reads to the replica picked for the current request, if any,
+    and everything else (writes, migrations, unmarked reads) to the primary.
+    """
+    def db_for_read(self, model, **hints):
+        return _replica_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
+
+
+# -----------------------------
+# View helpers
+# -----------------------------
+class ReplicaReadMixin:
+    """
+    For DRF views: run safe requests against a replica unless the user
+    wrote recently, and pin the user to the primary after a write.
+    """
+    def dispatch(self, request, *args, **kwargs):
+        self._replica_token = None
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            # Also on uncaught errors, or the alias leaks into this thread's next request
+            if self._replica_token is not None:
+                _replica_alias.reset(self._replica_token)
+                self._replica_token = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        alias = pick_replica(request)
+        if alias:
+            self._replica_token = _replica_alias.set(alias)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if (request.method not in SAFE_METHODS and response.status_code < 400
+                and request.user.is_authenticated):
+            pin_primary(request.user)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+def replica_reads(view_func):
+    """Same as ReplicaReadMixin for function views; apply below @api_view."""
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        alias = pick_replica(request)
+        if not alias:
+            return view_func(request, *args, **kwargs)
+        token = _replica_alias.set(alias)
+        try:
+            return view_func(request, *args, **kwargs)
+        finally:
+            _replica_alias.reset(token)
+    return wrapper
@@ -0,0 +1,62 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from jobs.queue import job
+from .models import Ticket, TimelineLog, ArchivedTimelineLog, IdempotencyKey
+from . import summaries
+
+logger = logging.getLogger(__name__)
+
+
+@job()
+def sla_breach_check(ticket_id=None):
+    """Record an 'sla_breached' timeline entry once for each breached open ticket."""
+    tickets = Ticket.objects.filter(
+        sla_deadline__lt=timezone.now(),
+        status__in=['open', 'in_progress']
+    ).exclude(timeline_logs__action_type='sla_breached')
+    if ticket_id is not None:
+        tickets = tickets.filter(pk=ticket_id)
+
+    for ticket in tickets:
+        TimelineLog.objects.create(
+            ticket=ticket,
+            action_type='sla_breached',
+            metadata={'sla_deadline': ticket.sla_deadline.isoformat(), 'assignee': ticket.assignee_display}
+        )
+        logger.warning("Ticket %s breached its SLA", ticket.pk)
+
+
+@job()
+def purge_idempotency_keys():
+    cutoff = timezone.now() - timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+    IdempotencyKey.objects.filter(created_at__lt=cutoff).delete()
+
+
+@job()
+def archive_timeline_logs(batch_size=1000):
+    """Move old timeline entries of closed tickets into ArchivedTimelineLog."""
+    cutoff = timezone.now() - timedelta(days=settings.TIMELINE_RETENTION_DAYS)
+    old_logs = TimelineLog.objects.filter(ticket__status='closed', created_at__lt=cutoff).order_by('pk')
+    while True:
+        with transaction.atomic():
+            logs = list(old_logs[:batch_size])
+            if not logs:
+                return
+            ArchivedTimelineLog.objects.bulk_create([
+                ArchivedTimelineLog(
+                    ticket_id=log.ticket_id,
+                    action_type=log.action_type,
+                    metadata=log.metadata,
+                    created_at=log.created_at,
+                )
+                for log in logs
+            ])
+            TimelineLog.objects.filter(pk__in=[log.pk for log in logs]).delete()
+
+
+@job()
+def reconcile_ticket_summaries():
+    summaries.reconcile_ticket_summaries()
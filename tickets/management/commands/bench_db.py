@@ -0,0 +1,34 @@
+import statistics
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_started, request_finished
+from django.conf import settings
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = "Time simulated request cycles against the database under the configured connection strategy."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200)
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError("--requests must be at least 1")
+        timings = []
+        for _ in range(options['requests']):
+            start = time.perf_counter()
+            # Same signals Django's handlers send, so CONN_MAX_AGE / pool
+            # decide whether the connection survives between "requests"
+            request_started.send(sender=self.__class__)
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            request_finished.send(sender=self.__class__)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        timings.sort()
+        p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+        self.stdout.write(
+            f"strategy={settings.DB_CONN_STRATEGY} vendor={connection.vendor} "
+            f"requests={len(timings)} p50={statistics.median(timings):.2f}ms p95={p95:.2f}ms"
+        )
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from tickets.summaries import reconcile_ticket_summaries
+
+
+class Command(BaseCommand):
+    help = "Recompute denormalized ticket summary fields (comment count, last comment, display names)."
+
+    def handle(self, *args, **options):
+        updated = reconcile_ticket_summaries()
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {updated} tickets"))
@@ -0,0 +1,85 @@
+import json
+import os
+import subprocess
+import sys
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+# Runs in a fresh interpreter: load the WSGI app and serve one authenticated
+# ticket list, so the timing includes auth, the DB connection, view and serializer
+FIRST_REQUEST = """
+import json, time
+start = time.perf_counter()
+from helpdeskmini_project.wsgi import application
+loaded = time.perf_counter()
+from wsgiref.util import setup_testing_defaults
+environ = {
+    'PATH_INFO': '/api/tickets/', 'QUERY_STRING': 'limit=1', 'REQUEST_METHOD': 'GET',
+    'HTTP_HOST': %r, 'HTTP_AUTHORIZATION': 'Bearer %s',
+}
+setup_testing_defaults(environ)
+status = []
+b''.join(application(environ, lambda s, h, exc_info=None: status.append(s)))
+done = time.perf_counter()
+print(json.dumps({'load_ms': (loaded - start) * 1000, 'first_request_ms': (done - start) * 1000, 'status': status[0]}))
+"""
+
+
+class Command(BaseCommand):
+    help = "Profile process cold start with -X importtime and time the first request."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20, help="Number of slowest imports to list.")
+        parser.add_argument('--lean', action='store_true', help="Profile with DJANGO_LEAN=True.")
+        parser.add_argument('--target-ms', type=int, default=settings.STARTUP_TARGET_MS)
+        parser.add_argument('--username', help="User to send the first request as; defaults to the first active user.")
+
+    def handle(self, *args, **options):
+        env = dict(os.environ)
+        if options['lean']:
+            env['DJANGO_LEAN'] = 'True'
+        host = next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h and h != '*'), 'localhost')
+        token = AccessToken.for_user(self._user(options['username']))
+
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', FIRST_REQUEST % (host, token)],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            # Last line that isn't -X importtime output, usually the exception
+            errors = [l for l in proc.stderr.splitlines() if l.strip() and not l.startswith('import time:')]
+            raise CommandError(errors[-1] if errors else f"Profiling process exited with code {proc.returncode}")
+
+        # stderr lines: "import time: <self us> | <cumulative us> | <module>"
+        imports = []
+        for line in proc.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, module = line[len('import time:'):].split('|')
+            imports.append((int(cumulative_us), int(self_us), module[1:].rstrip()))
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+        self.stdout.write(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for cumulative_us, self_us, module in sorted(imports, reverse=True)[:options['top']]:
+            self.stdout.write(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}")
+
+        self.stdout.write(
+            f"\n{len(imports)} modules imported, {sum(i[1] for i in imports) / 1000:.1f}ms in imports; "
+            f"app loaded in {result['load_ms']:.1f}ms, first request ({result['status']}) "
+            f"at {result['first_request_ms']:.1f}ms (target {options['target_ms']}ms)"
+        )
+        if not result['status'].startswith('200'):
+            raise CommandError(f"First request returned {result['status']}, not 200")
+        if result['first_request_ms'] > options['target_ms']:
+            raise CommandError("Time to first request is over target")
+
+    def _user(self, username):
+        users = get_user_model().objects.filter(is_active=True)
+        if username:
+            users = users.filter(username=username)
+        user = users.order_by('pk').first()
+        if user is None:
+            raise CommandError("No active user to send the first request as; create one or pass --username")
+        return user
@@ -0,0 +1,47 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_summaries(apps, schema_editor):
+    Ticket = apps.get_model('tickets', 'Ticket')
+    Comment = apps.get_model('tickets', 'Comment')
+    User = apps.get_model('tickets', 'User')
+    comments = Comment.objects.filter(ticket=OuterRef('pk'))
+    Ticket.objects.update(
+        comment_count=Coalesce(Subquery(comments.values('ticket').annotate(c=Count('id')).values('c')), 0),
+        last_comment_at=Subquery(comments.order_by('-created_at').values('created_at')[:1]),
+        created_by_display=Subquery(User.objects.filter(pk=OuterRef('created_by')).values('email')[:1]),
+        assignee_display=Subquery(User.objects.filter(pk=OuterRef('assignee')).values('email')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0002_alter_user_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='last_comment_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='created_by_display',
+            field=models.CharField(blank=True, max_length=254),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='assignee_display',
+            field=models.CharField(blank=True, max_length=254, null=True),
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 23:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0004_archivedtimelinelog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='last_write_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
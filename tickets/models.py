@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.contrib.auth.models import AbstractUser
 from django.utils import timezone
 from django.conf import settings
@@ -14,6 +16,8 @@ class User(AbstractUser):
     )
     email = models.EmailField(unique=True)  # <-- make it unique
     role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='user')
+    # Last API write; keeps this user's reads on the primary for a short while
+    last_write_at = models.DateTimeField(blank=True, null=True)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
@@ -58,6 +62,15 @@ class Ticket(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Denormalized summary for list pages (see reconcile_ticket_summaries)
+    comment_count = models.PositiveIntegerField(default=0)
+    last_comment_at = models.DateTimeField(blank=True, null=True)
+    created_by_display = models.CharField(max_length=254, blank=True)
+    assignee_display = models.CharField(max_length=254, blank=True, null=True)
+
+    # Only ever changed with F() updates from Comment.save()
+    COUNTER_FIELDS = ('comment_count', 'last_comment_at')
+
     def save(self, *args, **kwargs):
         # Auto-set SLA if not set
         if not self.sla_deadline:
@@ -68,9 +81,20 @@ class Ticket(models.Model):
             else:
                 self.sla_deadline = timezone.now() + timezone.timedelta(hours=72)
 
+        # Cached display strings
+        if not self.created_by_display:
+            self.created_by_display = str(self.created_by)
+        self.assignee_display = str(self.assignee) if self.assignee else None
+
         # Increment version on update
         if self.pk is not None:
             self.version += 1
+            # Don't overwrite counters bumped by concurrent comments
+            if kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+                kwargs['update_fields'] = [
+                    f.name for f in self._meta.concrete_fields
+                    if not f.primary_key and f.name not in self.COUNTER_FIELDS
+                ]
 
         super().save(*args, **kwargs)
 
@@ -95,7 +119,15 @@ class Comment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
+        is_new = self.pk is None
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if is_new:
+                Ticket.objects.filter(pk=self.ticket_id).update(
+                    comment_count=F('comment_count') + 1,
+                    # Only move forward if comments commit out of order
+                    last_comment_at=Greatest(Coalesce('last_comment_at', Value(self.created_at)), Value(self.created_at)),
+                )
         # Create timeline log
         TimelineLog.objects.create(
             ticket=self.ticket,
@@ -111,3 +143,14 @@ class TimelineLog(models.Model):
     action_type = models.CharField(max_length=50)
     metadata = models.JSONField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+
+# -----------------------------
+# Archived Timeline Log Model
+# -----------------------------
+class ArchivedTimelineLog(models.Model):
+    # Plain id rather than a foreign key so history outlives the ticket
+    ticket_id = models.BigIntegerField(db_index=True)
+    action_type = models.CharField(max_length=50)
+    metadata = models.JSONField(blank=True, null=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
@@ -34,8 +34,8 @@ class CommentSerializer(serializers.ModelSerializer):
 # Ticket Serializer
 # -----------------------------
 class TicketSerializer(serializers.ModelSerializer):
-    created_by = serializers.StringRelatedField(read_only=True)
-    assignee = serializers.StringRelatedField(read_only=True)
+    created_by = serializers.CharField(source='created_by_display', read_only=True)
+    assignee = serializers.CharField(source='assignee_display', read_only=True)
     comments = serializers.SerializerMethodField()
     timeline_logs = serializers.SerializerMethodField()
     sla_remaining = serializers.SerializerMethodField()
@@ -45,9 +45,12 @@ class TicketSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'priority', 'status', 'created_by',
             'assignee', 'sla_deadline', 'sla_remaining', 'version', 'created_at',
-            'updated_at', 'comments', 'timeline_logs'
+            'updated_at', 'comment_count', 'last_comment_at', 'comments', 'timeline_logs'
+        ]
+        read_only_fields = [
+            'created_by', 'sla_deadline', 'version', 'created_at', 'updated_at',
+            'comment_count', 'last_comment_at'
         ]
-        read_only_fields = ['created_by', 'sla_deadline', 'version', 'created_at', 'updated_at']
 
     def get_comments(self, obj):
         top_level_comments = obj.comments.filter(parent__isnull=True).order_by('created_at')
@@ -68,3 +71,15 @@ class TicketSerializer(serializers.ModelSerializer):
             minutes, _ = divmod(remainder, 60)
             return f"{hours}h {minutes}m"
         return None
+
+
+# -----------------------------
+# Ticket List Serializer
+# -----------------------------
+class TicketListSerializer(TicketSerializer):
+    """Summary fields only; comments and timeline come from the detail endpoint."""
+    comments = None
+    timeline_logs = None
+
+    class Meta(TicketSerializer.Meta):
+        fields = [f for f in TicketSerializer.Meta.fields if f not in ('comments', 'timeline_logs')]
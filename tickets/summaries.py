@@ -0,0 +1,17 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from .models import Ticket, Comment
+
+
+def reconcile_ticket_summaries():
+    """Recompute denormalized ticket summary fields; returns the number of tickets updated."""
+    User = get_user_model()
+    comments = Comment.objects.filter(ticket=OuterRef('pk'))
+    # Single UPDATE ... SET col = (subquery); doesn't touch updated_at or version
+    return Ticket.objects.update(
+        comment_count=Coalesce(Subquery(comments.values('ticket').annotate(c=Count('id')).values('c')), 0),
+        last_comment_at=Subquery(comments.order_by('-created_at').values('created_at')[:1]),
+        created_by_display=Subquery(User.objects.filter(pk=OuterRef('created_by')).values('email')[:1]),
+        assignee_display=Subquery(User.objects.filter(pk=OuterRef('assignee')).values('email')[:1]),
+    )
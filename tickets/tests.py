@@ -1,3 +1,214 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from .db_router import _replica_alias
+from .jobs import archive_timeline_logs
+from .models import Ticket, Comment, TimelineLog, ArchivedTimelineLog
 
-# Create your tests here.
+User = get_user_model()
+
+
+# -----------------------------
+# Read-replica routing
+# -----------------------------
+@override_settings(DATABASE_REPLICAS=['replica_0'])
+class ReplicaRoutingTests(TransactionTestCase):
+    # Real commits, so the mirror connection sees the data
+    databases = {'default', 'replica_0'}
+
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', email='admin@mail.com', password='pw', role='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def replica_queries(self, method, url, data=None, client=None):
+        with CaptureQueriesContext(connections['replica_0']) as replica:
+            response = getattr(client or self.client, method)(url, data, format='json')
+        return response, len(replica.captured_queries)
+
+    def test_safe_reads_use_replica(self):
+        response, queries = self.replica_queries('get', '/api/tickets/')
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(queries, 0)
+
+        response, queries = self.replica_queries('get', '/api/users/')
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(queries, 0)
+
+    def test_replica_chosen_once_per_request(self):
+        Ticket.objects.create(title='t', description='d', created_by=self.admin)
+        with mock.patch('tickets.db_router.random.choice', return_value='replica_0') as choice:
+            # Paginated list: count() and page query must agree
+            response = self.client.get('/api/tickets/')
+        self.assertEqual(response.data['count'], 1)
+        choice.assert_called_once()
+
+    def test_writes_use_primary_and_pin_user(self):
+        response, queries = self.replica_queries('post', '/api/tickets/', {'title': 't', 'description': 'd'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(queries, 0)
+
+        # The next read stays on the primary, from any client of this user
+        other_client = APIClient()
+        other_client.force_authenticate(User.objects.get(pk=self.admin.pk))
+        response, queries = self.replica_queries('get', '/api/tickets/', client=other_client)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(queries, 0)
+        self.assertEqual(response.data['count'], 1)
+
+    def test_pin_expires(self):
+        self.client.post('/api/tickets/', {'title': 't', 'description': 'd'}, format='json')
+        with override_settings(REPLICA_STICKY_SECONDS=0):
+            _, queries = self.replica_queries('get', '/api/tickets/')
+        self.assertGreater(queries, 0)
+
+    def test_pin_belongs_to_the_writing_user(self):
+        self.client.post('/api/tickets/', {'title': 't', 'description': 'd'}, format='json')
+        other = User.objects.create_user(username='other', email='other@mail.com', password='pw')
+        self.client.force_authenticate(other)
+        _, queries = self.replica_queries('get', '/api/tickets/')
+        self.assertGreater(queries, 0)
+
+    def test_failed_write_does_not_pin(self):
+        response = self.client.post('/api/tickets/', {}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(User.objects.get(pk=self.admin.pk).last_write_at)
+
+    def test_uncaught_error_resets_replica(self):
+        with mock.patch('tickets.views.TicketViewSet.breached', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self.client.get('/api/tickets/breached/')
+        self.assertIsNone(_replica_alias.get())
+
+
+# -----------------------------
+# Denormalized ticket summaries
+# -----------------------------
+class TicketSummaryTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', email='admin@mail.com', password='pw', role='admin')
+        self.agent = User.objects.create_user(username='agent', email='agent@mail.com', password='pw', role='agent')
+        self.ticket = Ticket.objects.create(title='t', description='d', created_by=self.admin)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def add_comment(self, text='hello'):
+        response = self.client.post(f'/api/tickets/{self.ticket.id}/add_comment/', {'text': text}, format='json')
+        self.assertEqual(response.status_code, 201)
+        return Comment.objects.get(pk=response.data['id'])
+
+    def test_new_ticket_caches_creator(self):
+        self.assertEqual(self.ticket.created_by_display, 'admin@mail.com')
+        self.assertIsNone(self.ticket.assignee_display)
+        self.assertEqual(self.ticket.comment_count, 0)
+
+    def test_add_comment_updates_summary(self):
+        self.add_comment()
+        comment = self.add_comment()
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.comment_count, 2)
+        self.assertEqual(self.ticket.last_comment_at, comment.created_at)
+
+    def test_last_comment_at_only_moves_forward(self):
+        latest = self.add_comment()
+        earlier = timezone.now() - timedelta(minutes=5)
+        # A comment stamped earlier that commits later
+        with mock.patch('django.utils.timezone.now', return_value=earlier):
+            self.add_comment()
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.comment_count, 2)
+        self.assertEqual(self.ticket.last_comment_at, latest.created_at)
+
+    def test_ticket_save_keeps_counters(self):
+        stale = Ticket.objects.get(pk=self.ticket.pk)
+        comment = self.add_comment()
+        stale.status = 'in_progress'
+        stale.save()
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.status, 'in_progress')
+        self.assertEqual(self.ticket.comment_count, 1)
+        self.assertEqual(self.ticket.last_comment_at, comment.created_at)
+
+    def test_assign_agent_keeps_counters(self):
+        self.add_comment()
+        response = self.client.patch(
+            f'/api/tickets/{self.ticket.id}/assign_agent/', {'agent_id': self.agent.id}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['assignee'], 'agent@mail.com')
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.assignee_display, 'agent@mail.com')
+        self.assertEqual(self.ticket.comment_count, 1)
+
+    def test_reconcile_ticket_summaries(self):
+        comment = self.add_comment()
+        Ticket.objects.filter(pk=self.ticket.pk).update(
+            comment_count=7, last_comment_at=None, created_by_display='', assignee=self.agent
+        )
+        call_command('reconcile_ticket_summaries', stdout=StringIO())
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.comment_count, 1)
+        self.assertEqual(self.ticket.last_comment_at, comment.created_at)
+        self.assertEqual(self.ticket.created_by_display, 'admin@mail.com')
+        self.assertEqual(self.ticket.assignee_display, 'agent@mail.com')
+
+
+# -----------------------------
+# List vs detail payloads
+# -----------------------------
+class TicketListPayloadTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', email='admin@mail.com', password='pw', role='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        for i in range(3):
+            ticket = Ticket.objects.create(title=f't{i}', description='d', created_by=self.admin)
+            parent = Comment.objects.create(ticket=ticket, user=self.admin, text='hello')
+            Comment.objects.create(ticket=ticket, user=self.admin, text='reply', parent=parent)
+        self.ticket = ticket
+
+    def test_list_carries_summaries_only(self):
+        # Count plus page, however many comments and logs the tickets have
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/tickets/?limit=5')
+        self.assertEqual(response.status_code, 200)
+        for row in response.data['results']:
+            self.assertNotIn('comments', row)
+            self.assertNotIn('timeline_logs', row)
+            self.assertEqual(row['comment_count'], 2)
+
+    def test_detail_carries_comments_and_timeline(self):
+        response = self.client.get(f'/api/tickets/{self.ticket.id}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['comments']), 1)
+        self.assertEqual(len(response.data['comments'][0]['replies']), 1)
+        self.assertTrue(response.data['timeline_logs'])
+
+
+# -----------------------------
+# Timeline archival job
+# -----------------------------
+@override_settings(TIMELINE_RETENTION_DAYS=30)
+class ArchiveTimelineTests(TestCase):
+    def test_archives_old_logs_of_closed_tickets(self):
+        admin = User.objects.create_user(username='admin', email='admin@mail.com', password='pw', role='admin')
+        closed = Ticket.objects.create(title='c', description='d', created_by=admin, status='closed')
+        open_ticket = Ticket.objects.create(title='o', description='d', created_by=admin)
+        old = timezone.now() - timedelta(days=31)
+        TimelineLog.objects.update(created_at=old)
+        recent = TimelineLog.objects.create(ticket=closed, action_type='updated')
+
+        archive_timeline_logs(batch_size=1)
+
+        self.assertEqual(list(closed.timeline_logs.all()), [recent])
+        self.assertEqual(open_ticket.timeline_logs.count(), 1)
+        archived = ArchivedTimelineLog.objects.get()
+        self.assertEqual(archived.ticket_id, closed.id)
+        self.assertEqual(archived.created_at, old)
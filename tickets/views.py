@@ -7,7 +7,9 @@ from django.utils import timezone
 from django.db.models import Q
 from django.contrib.auth import get_user_model
 from .models import Ticket, Comment, TimelineLog
-from .serializers import TicketSerializer, CommentSerializer, TimelineSerializer
+from .serializers import TicketSerializer, TicketListSerializer, CommentSerializer, TimelineSerializer
+from .db_router import ReplicaReadMixin, replica_reads
+from jobs.queue import enqueue
 
 from .models import IdempotencyKey
 
@@ -59,13 +61,19 @@ class IsOwnerOrAgentOrAdmin(BasePermission):
 # -----------------------------
 # Ticket ViewSet
 # -----------------------------
-class TicketViewSet(viewsets.ModelViewSet):
+class TicketViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     serializer_class = TicketSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrAgentOrAdmin]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
     search_fields = ['title', 'description', 'comments__text']
     ordering_fields = ['created_at', 'priority', 'status', 'sla_deadline']
 
+    def get_serializer_class(self):
+        # Lists carry summaries only; details are fetched per ticket
+        if self.action in ('list', 'breached'):
+            return TicketListSerializer
+        return TicketSerializer
+
     def get_queryset(self):
         """Return tickets according to role with optional search."""
         qs = Ticket.objects.all().order_by('-created_at')
@@ -100,6 +108,8 @@ class TicketViewSet(viewsets.ModelViewSet):
             action_type='created',
             metadata={'user': self.request.user.username}
         )
+        # Flag the breach as soon as the SLA runs out
+        enqueue('sla_breach_check', {'ticket_id': ticket.id}, run_at=ticket.sla_deadline)
 
     # -----------------------------
     # Update ticket with optimistic locking
@@ -213,6 +223,7 @@ class TicketViewSet(viewsets.ModelViewSet):
 # API view to fetch all agents
 # -----------------------------
 @api_view(['GET'])
+@replica_reads
 def list_agents(request):
     if request.user.role != 'admin':
         return Response({"error": "FORBIDDEN"}, status=403)